@@ -13,26 +13,151 @@ Requirements:
 """
 
 import os
+import errno
+import functools
 import shutil
 import argparse
 import logging
 import sqlite3
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
 import re
 
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows
+    fcntl = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# ioctl request number for reflink (copy-on-write) clones on btrfs/XFS
+FICLONE = 0x40049409
+
+# Calibre's auto-generated numbering suffix at the end of titles, e.g. " (84)"
+_TITLE_SUFFIX_RE = re.compile(r'\s*\(\d+\)\s*$')
+_SPACED_TITLE_SUFFIX_RE = re.compile(r'\s+\(\d+\)\s*$')
+
+# Characters that are invalid in filenames on at least one platform, mapped to '_'
+_INVALID_FILENAME_CHARS = str.maketrans('<>:"/\\|?*', '_' * 9)
+
+# Number of metadata rows fetched from the Calibre database at a time
+METADATA_BATCH_SIZE = 1000
+
+# Maximum number of books queued for the worker threads at a time
+MAX_PENDING_BOOKS = 1000
+
+# Default number of books migrated concurrently (the work is I/O bound)
+DEFAULT_JOBS = min(32, (os.cpu_count() or 4) * 4)
+
+# Errors meaning "this copy mechanism isn't supported here", so try the next one
+_COPY_FALLBACK_ERRNOS = {errno.ENOTSUP, errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL, errno.ENOTTY, errno.ENOSYS}
+
+
+def _fast_copy(src, dst) -> None:
+    """Copy a file using the cheapest mechanism available, preserving metadata like shutil.copy2.
+
+    Tries a reflink clone first, then an in-kernel os.copy_file_range, and finally
+    falls back to a regular userspace copy.
+    """
+    with open(src, 'rb') as fsrc:
+        fdst = open(dst, 'xb')
+        try:
+            with fdst:
+                src_fd = fsrc.fileno()
+                dst_fd = fdst.fileno()
+                copied = False
+                
+                # Hint that the source is read once, front to back
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                
+                if fcntl is not None:
+                    try:
+                        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+                        copied = True
+                    except OSError as e:
+                        if e.errno not in _COPY_FALLBACK_ERRNOS:
+                            raise
+                
+                if not copied and hasattr(os, 'copy_file_range'):
+                    try:
+                        total = 0
+                        while True:
+                            written = os.copy_file_range(src_fd, dst_fd, 2 ** 30)
+                            if not written:
+                                break
+                            total += written
+                        # Some filesystems report 0 bytes instead of failing; use the
+                        # fallback copy unless the source really is empty
+                        copied = total > 0 or os.fstat(src_fd).st_size == 0
+                    except OSError as e:
+                        if e.errno not in _COPY_FALLBACK_ERRNOS:
+                            raise
+                        # Discard anything partially written before retrying
+                        fsrc.seek(0)
+                        fdst.seek(0)
+                        fdst.truncate()
+                
+                if not copied:
+                    shutil.copyfileobj(fsrc, fdst)
+                    fdst.flush()
+                
+                # Neither file will be read again, so don't let them push other data out of the page cache
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                    os.posix_fadvise(dst_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            
+            shutil.copystat(src, dst)
+        except BaseException:
+            # Never leave a partial file behind; later runs would treat it as migrated
+            os.unlink(dst)
+            raise
+
+
+class BookMetadata(NamedTuple):
+    """Metadata for a single book from the Calibre database."""
+    id: int
+    title: str
+    author: str
+    series: Optional[str]
+    series_index: Optional[float]
+    # Maps each supported format (lowercase extension) to its file name without extension
+    files: Dict[str, str]
+
+
+def _format_volume(series_index: float) -> str:
+    """Format a series index as a volume number, e.g. 1.0 -> "01" and 2.5 -> "002_5"."""
+    whole = int(series_index)
+    if series_index == whole:
+        # Whole number
+        return f"{whole:02d}"
+    # Decimal number
+    return f"{series_index:05.1f}".replace('.', '_')
+
+
 class CalibreKomgaMigrator:
-    def __init__(self, calibre_path: str, komga_path: str, dry_run: bool = False):
+    def __init__(self, calibre_path: str, komga_path: str, dry_run: bool = False,
+                 transfer_mode: Optional[str] = None, jobs: int = DEFAULT_JOBS):
         self.calibre_path = Path(calibre_path)
+        self.calibre_path_str = str(self.calibre_path)
         self.komga_path = Path(komga_path)
         self.dry_run = dry_run
         
-        # Supported ebook formats - only epub and kepub
-        self.supported_formats = {'.epub', '.kepub'}
+        # How files are placed in the Komga library: None (copy), 'hardlink', 'symlink' or 'move'
+        self.transfer_mode = transfer_mode
+        
+        # Number of books migrated concurrently
+        self.jobs = max(1, jobs)
+        
+        # Supported ebook formats (extensions without the dot) - only epub and kepub
+        self.supported_formats = frozenset({'epub', 'kepub'})
+        self.supported_suffixes = tuple(f".{fmt}" for fmt in self.supported_formats)
         
         # Statistics
         self.stats = {
@@ -41,10 +166,26 @@ class CalibreKomgaMigrator:
             'skipped_books': 0,
             'errors': 0
         }
+        self._stats_lock = threading.Lock()
+        
+        # Serializes the existence check and rename in move mode, since os.rename
+        # silently replaces an existing destination on POSIX
+        self._move_lock = threading.Lock()
+        
+        # Series folders already created in the Komga library
+        self._created_dirs = set()
+        self._created_dirs_lock = threading.Lock()
+        
+        # Destination files this run has created or is creating, so files from a
+        # previous run can be told apart from name collisions within this run
+        self._claimed_files = set()
+        self._claimed_files_lock = threading.Lock()
+        
+        # Book directories of each scanned author folder in the Calibre library
+        self._book_dirs = {}
         
-        # Calibre metadata database connection
+        # Calibre metadata database
         self.metadata_db_path = self.calibre_path / 'metadata.db'
-        self.metadata_cache = {}
     
     def validate_paths(self) -> bool:
         """Validate that the source and destination paths exist and are accessible."""
@@ -65,71 +206,110 @@ class CalibreKomgaMigrator:
         if not self.dry_run:
             self.komga_path.mkdir(parents=True, exist_ok=True)
         
+        # Hardlinks can't cross filesystems, so fail once here instead of for every book
+        if self.transfer_mode == 'hardlink' and self.komga_path.exists():
+            if self.calibre_path.stat().st_dev != self.komga_path.stat().st_dev:
+                logger.error(f"--hardlink requires the Calibre and Komga libraries to be on the same filesystem: "
+                             f"{self.calibre_path} and {self.komga_path} are not")
+                return False
+        
         return True
     
-    def load_calibre_metadata(self) -> bool:
-        """Load metadata from Calibre database."""
+    def iter_calibre_metadata(self, author_filter: Optional[str] = None) -> Iterator[Tuple[str, BookMetadata]]:
+        """Stream book metadata from Calibre database as (path, metadata) pairs."""
+        conn = sqlite3.connect(self.metadata_db_path)
         try:
-            conn = sqlite3.connect(self.metadata_db_path)
-            cursor = conn.cursor()
+            # Give SQLite a larger page cache and let it mmap the database; we never write to it
+            conn.execute("PRAGMA cache_size=-40000")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA query_only=1")
+            
+            # SQLite's own case folding only covers ASCII, so match authors with Python's
+            conn.create_function('py_casefold', 1, lambda value: value.casefold() if value is not None else None)
+            
+            # Only join the data rows of supported formats
+            format_placeholders = ', '.join('?' * len(self.supported_formats))
+            params = list(self.supported_formats)
+            
+            # Apply author filter in the query (case insensitive partial match). Matching
+            # book ids are looked up from the authors table first, so the main query only
+            # visits matching books.
+            where_clause = ""
+            if author_filter:
+                where_clause = """
+            WHERE b.id IN (
+                SELECT fbal.book
+                FROM authors fa
+                JOIN books_authors_link fbal ON fbal.author = fa.id
+                WHERE instr(py_casefold(fa.name), ?) > 0
+            )"""
+                params.append(author_filter.casefold())
             
             # Query to get book metadata including series information
-            query = """
+            query = f"""
             SELECT 
                 b.id,
                 b.title,
                 b.path,
                 b.series_index,
-                a.name as author_name,
+                (
+                    -- Primary author in Calibre's author order, independent of any filter
+                    SELECT a.name
+                    FROM books_authors_link bal
+                    JOIN authors a ON a.id = bal.author
+                    WHERE bal.book = b.id
+                    ORDER BY bal.id
+                    LIMIT 1
+                ) as author_name,
                 s.name as series_name,
-                GROUP_CONCAT(d.name, ',') as formats
+                GROUP_CONCAT(lower(d.format) || ':' || d.name, '|') as files
             FROM books b
-            LEFT JOIN books_authors_link bal ON b.id = bal.book
-            LEFT JOIN authors a ON bal.author = a.id
             LEFT JOIN books_series_link bsl ON b.id = bsl.book
             LEFT JOIN series s ON bsl.series = s.id
-            LEFT JOIN data d ON b.id = d.book
+            LEFT JOIN data d ON b.id = d.book AND lower(d.format) IN ({format_placeholders})
+            {where_clause}
             GROUP BY b.id
-            ORDER BY a.name, s.name, b.series_index, b.title
             """
             
-            cursor.execute(query)
-            results = cursor.fetchall()
+            cursor = conn.execute(query, params)
             
-            for row in results:
-                book_id, title, path, series_index, author_name, series_name, formats = row
-                
-                # Handle multiple authors (take the first one for simplicity)
-                if author_name:
-                    author_name = author_name.split(',')[0].strip()
+            # Fetch in batches so only a limited number of rows is held in memory
+            while True:
+                rows = cursor.fetchmany(METADATA_BATCH_SIZE)
+                if not rows:
+                    break
                 
-                self.metadata_cache[path] = {
-                    'id': book_id,
-                    'title': title,
-                    'author': author_name or 'Unknown Author',
-                    'series': series_name,
-                    'series_index': series_index,
-                    'formats': formats.split(',') if formats else []
-                }
-            
+                for row in rows:
+                    book_id, title, path, series_index, author_name, series_name, files = row
+                    
+                    # Handle multiple authors (take the first one for simplicity)
+                    if author_name:
+                        author_name = author_name.split(',')[0].strip()
+                    
+                    # Map each format to its file name (without extension) in the book folder.
+                    # Calibre never uses ':' or '|' in file names, so they are safe separators.
+                    book_files = {}
+                    if files:
+                        for entry in files.split('|'):
+                            fmt, _, file_name = entry.partition(':')
+                            book_files[fmt] = file_name
+                    
+                    yield path, BookMetadata(
+                        id=book_id,
+                        title=title,
+                        author=author_name or 'Unknown Author',
+                        series=series_name,
+                        series_index=series_index,
+                        files=book_files
+                    )
+        finally:
             conn.close()
-            logger.info(f"Loaded metadata for {len(self.metadata_cache)} books from Calibre database")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error loading Calibre metadata: {str(e)}")
-            return False
     
-    def get_book_metadata(self, book_path: Path) -> Optional[Dict]:
-        """Get metadata for a specific book from the cache."""
-        # Convert absolute path to relative path from calibre library
-        try:
-            relative_path = book_path.relative_to(self.calibre_path)
-            path_key = str(relative_path).replace('\\', '/')
-            return self.metadata_cache.get(path_key)
-        except ValueError:
-            # Path is not relative to calibre_path
-            return None
+    def increment_stat(self, name: str) -> None:
+        """Increment a statistics counter (safe to call from worker threads)."""
+        with self._stats_lock:
+            self.stats[name] += 1
     
     def clean_calibre_title(self, title: str) -> str:
         """Remove Calibre's automatically generated numbering suffixes from titles."""
@@ -138,17 +318,17 @@ class CalibreKomgaMigrator:
         
         # Remove patterns like " (84)", " (123)", etc. at the end of titles
         # This matches parentheses with only numbers inside at the end of the string
-        cleaned = re.sub(r'\s*\(\d+\)\s*$', '', title)
+        cleaned = _TITLE_SUFFIX_RE.sub('', title)
         
         # Also handle cases with multiple spaces before parentheses
-        cleaned = re.sub(r'\s+\(\d+\)\s*$', '', cleaned)
+        cleaned = _SPACED_TITLE_SUFFIX_RE.sub('', cleaned)
         
         return cleaned.strip()
     
     def sanitize_filename(self, filename: str) -> str:
         """Sanitize filename for cross-platform compatibility."""
         # Remove or replace invalid characters
-        sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
+        sanitized = filename.translate(_INVALID_FILENAME_CHARS)
         # Remove leading/trailing spaces and dots
         sanitized = sanitized.strip('. ')
         # Limit length to reasonable size
@@ -156,11 +336,9 @@ class CalibreKomgaMigrator:
             sanitized = sanitized[:100]
         return sanitized
     
-    def get_series_folder_name(self, metadata: Dict) -> str:
-        """Generate series folder name from metadata."""
-        author = metadata.get('author', 'Unknown Author')
-        series = metadata.get('series')
-        
+    @functools.lru_cache(maxsize=None)
+    def get_series_folder_name(self, author: str, series: Optional[str]) -> str:
+        """Generate series folder name from author and series."""
         if series:
             # Use actual series name from Calibre
             return self.sanitize_filename(f"{author} - {series}")
@@ -168,79 +346,148 @@ class CalibreKomgaMigrator:
             # For standalone books, use author as series name
             return self.sanitize_filename(f"{author}")
     
-    def get_file_name(self, metadata: Dict, original_filename: str) -> str:
-        """Generate the filename for the book file."""
-        title = metadata.get('title', 'Unknown Title')
-        series_index = metadata.get('series_index')
-        series = metadata.get('series')
+    def get_file_stem(self, metadata: BookMetadata) -> str:
+        """Generate the filename for the book, without extension."""
+        title = metadata.title
+        series_index = metadata.series_index
+        series = metadata.series
         
         # Clean the title of Calibre's auto-generated numbering
         clean_title = self.clean_calibre_title(title)
         
-        # Get the original file extension
-        original_path = Path(original_filename)
-        extension = original_path.suffix
-        
         if series and series_index:
             # For books in a series, use "Volume XX - Title" format
-            if series_index == int(series_index):
-                # Whole number
-                volume_num = str(int(series_index)).zfill(2)
-            else:
-                # Decimal number
-                volume_num = f"{series_index:05.1f}".replace('.', '_')
-            filename = f"Volume {volume_num} - {clean_title}"
+            filename = f"Volume {_format_volume(series_index)} - {clean_title}"
         else:
             # For standalone books, just use the title
             filename = clean_title
         
-        return self.sanitize_filename(filename) + extension
+        return self.sanitize_filename(filename)
+    
+    def get_file_name(self, metadata: BookMetadata, original_filename: str) -> str:
+        """Generate the filename for the book file."""
+        # Keep the original file extension
+        extension = Path(original_filename).suffix
+        return self.get_file_stem(metadata) + extension
+    
+    def is_already_migrated(self, metadata: BookMetadata, series_path: Path) -> bool:
+        """Check whether every supported format of a book was migrated by a previous run."""
+        if not metadata.files:
+            return False
+        
+        file_stem = os.path.join(series_path, self.get_file_stem(metadata))
+        dest_files = [f"{file_stem}.{fmt}" for fmt in metadata.files]
+        
+        # Files created during this run belong to another book with the same name;
+        # let the regular path report those collisions
+        with self._claimed_files_lock:
+            if any(dest_file in self._claimed_files for dest_file in dest_files):
+                return False
+        
+        return all(os.path.exists(dest_file) for dest_file in dest_files)
     
-    def find_ebook_files(self, book_path: Path) -> List[Path]:
+    def find_ebook_files(self, book_path: str) -> List[Path]:
         """Find all ebook files in a book's directory."""
         files = []
-        for file_path in book_path.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() in self.supported_formats:
-                files.append(file_path)
+        with os.scandir(book_path) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(self.supported_suffixes) and entry.is_file(follow_symlinks=False):
+                    files.append(Path(entry.path))
         return files
     
-    def migrate_book(self, book_path: Path) -> bool:
-        """Migrate a single book from Calibre to Komga structure."""
-        # Get metadata from Calibre database
-        metadata = self.get_book_metadata(book_path)
-        if not metadata:
-            logger.warning(f"No metadata found for {book_path}, skipping")
-            self.stats['skipped_books'] += 1
-            return False
+    def book_dir_exists(self, path_key: str) -> bool:
+        """Check whether a book directory ('Author/Title') exists in the Calibre library."""
+        # Each author folder is scanned once, the first time one of its books is checked,
+        # so only authors that appear in the migrated rows are read
+        author_dir, _, title_dir = path_key.partition('/')
+        if not title_dir:
+            return os.path.isdir(os.path.join(self.calibre_path_str, path_key))
         
-        author_name = metadata['author']
-        book_title = metadata['title']
+        title_dirs = self._book_dirs.get(author_dir)
+        if title_dirs is None:
+            title_dirs = set()
+            try:
+                with os.scandir(os.path.join(self.calibre_path_str, author_dir)) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            title_dirs.add(entry.name)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Cannot read directory {os.path.join(self.calibre_path_str, author_dir)}: {str(e)}")
+            self._book_dirs[author_dir] = title_dirs
         
-        # Find ebook files
-        ebook_files = self.find_ebook_files(book_path)
-        if not ebook_files:
-            logger.warning(f"No supported ebook files found in {book_path}")
-            self.stats['skipped_books'] += 1
-            return False
+        return title_dir in title_dirs
+    
+    def list_existing_series_folders(self) -> List[str]:
+        """List the series folders already present in the Komga library."""
+        with os.scandir(self.komga_path) as entries:
+            return [entry.name for entry in entries if entry.is_dir()]
+    
+    def transfer_file(self, src: Path, dst: Path) -> None:
+        """Place a single ebook file at its destination according to the transfer mode."""
+        if self.transfer_mode == 'hardlink':
+            os.link(src, dst)
+        elif self.transfer_mode == 'symlink':
+            os.symlink(os.path.abspath(src), dst)
+        elif self.transfer_mode == 'move':
+            try:
+                with self._move_lock:
+                    if os.path.exists(dst):
+                        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(dst))
+                    os.rename(src, dst)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # Different filesystems: copy, then remove the source
+                _fast_copy(src, dst)
+                os.unlink(src)
+        else:
+            _fast_copy(src, dst)
+    
+    def migrate_book(self, book_path: str, metadata: BookMetadata) -> bool:
+        """Migrate a single book from Calibre to Komga structure."""
+        author_name = metadata.author
+        book_title = metadata.title
         
         # Generate series folder name
-        series_folder = self.get_series_folder_name(metadata)
+        series_folder = self.get_series_folder_name(metadata.author, metadata.series)
         series_path = self.komga_path / series_folder
         
-        # Show series info if available
-        series_info = ""
-        if metadata.get('series'):
-            series_info = f" (Series: {metadata['series']}"
-            if metadata.get('series_index'):
-                series_info += f", Index: {metadata['series_index']}"
-            series_info += ")"
+        # Skip books from a previous run without scanning the source directory
+        if not self.dry_run and self.is_already_migrated(metadata, series_path):
+            logger.info("Already migrated, skipping: %s/%s", author_name, book_title)
+            self.increment_stat('skipped_books')
+            return False
         
-        logger.info(f"Migrating: {author_name}/{book_title}{series_info} -> {series_folder}/")
+        # Build ebook file paths from Calibre's data table; scan the book directory
+        # when the database lists no supported formats or is out of sync with the files
+        ebook_files = [Path(book_path, f"{file_name}.{fmt}") for fmt, file_name in metadata.files.items()]
+        if not ebook_files or not all(os.path.isfile(ebook_file) for ebook_file in ebook_files):
+            ebook_files = self.find_ebook_files(book_path)
+        if not ebook_files:
+            logger.warning("No supported ebook files found in %s", book_path)
+            self.increment_stat('skipped_books')
+            return False
+        
+        # Show series info if available; skip building it when INFO logging is disabled
+        if logger.isEnabledFor(logging.INFO):
+            series_info = ""
+            if metadata.series:
+                series_info = f" (Series: {metadata.series}"
+                if metadata.series_index:
+                    series_info += f", Index: {metadata.series_index}"
+                series_info += ")"
+            
+            logger.info("Migrating: %s/%s%s -> %s/", author_name, book_title, series_info, series_folder)
         
         if not self.dry_run:
             try:
-                # Create series directory
-                series_path.mkdir(parents=True, exist_ok=True)
+                # Create series directory (once per series)
+                with self._created_dirs_lock:
+                    if series_folder not in self._created_dirs:
+                        series_path.mkdir(parents=True, exist_ok=True)
+                        self._created_dirs.add(series_folder)
                 
                 # Copy ebook files directly to series folder
                 for ebook_file in ebook_files:
@@ -248,26 +495,29 @@ class CalibreKomgaMigrator:
                     new_filename = self.get_file_name(metadata, ebook_file.name)
                     dest_file = series_path / new_filename
                     
-                    if dest_file.exists():
-                        logger.warning(f"File already exists, skipping: {dest_file}")
-                        continue
+                    with self._claimed_files_lock:
+                        self._claimed_files.add(str(dest_file))
                     
-                    shutil.copy2(ebook_file, dest_file)
-                    logger.debug(f"Copied: {ebook_file} -> {dest_file}")
+                    try:
+                        self.transfer_file(ebook_file, dest_file)
+                    except FileExistsError:
+                        logger.warning("File already exists, skipping: %s", dest_file)
+                        continue
+                    logger.debug("Copied: %s -> %s", ebook_file, dest_file)
                 
-                self.stats['migrated_books'] += 1
+                self.increment_stat('migrated_books')
                 return True
                 
             except Exception as e:
-                logger.error(f"Error migrating {book_path}: {str(e)}")
-                self.stats['errors'] += 1
+                logger.error("Error migrating %s: %s", book_path, e)
+                self.increment_stat('errors')
                 return False
         else:
             # Show what files would be created
             for ebook_file in ebook_files:
                 new_filename = self.get_file_name(metadata, ebook_file.name)
-                logger.info(f"[DRY RUN] Would create: {series_path / new_filename}")
-            self.stats['migrated_books'] += 1
+                logger.info("[DRY RUN] Would create: %s", series_path / new_filename)
+            self.increment_stat('migrated_books')
             return True
     
     def migrate_library(self, author_filter: Optional[str] = None) -> None:
@@ -278,25 +528,40 @@ class CalibreKomgaMigrator:
         if not self.validate_paths():
             return
         
-        # Load metadata from Calibre database
-        if not self.load_calibre_metadata():
-            logger.error("Failed to load Calibre metadata. Exiting.")
-            return
+        # Series folders left by a previous run don't need to be created again
+        if not self.dry_run:
+            self._created_dirs.update(self.list_existing_series_folders())
         
-        # Process books based on metadata
-        for path_key, metadata in self.metadata_cache.items():
-            book_path = self.calibre_path / path_key
-            
-            if not book_path.exists() or not book_path.is_dir():
-                logger.warning(f"Book path does not exist: {book_path}")
-                continue
-            
-            # Apply author filter if specified
-            if author_filter and author_filter.lower() not in metadata['author'].lower():
-                continue
+        try:
+            # Dry runs only log, so use one worker to keep each book's log lines together
+            workers = 1 if self.dry_run else self.jobs
             
-            self.stats['total_books'] += 1
-            self.migrate_book(book_path)
+            # Stream metadata from the Calibre database and migrate books concurrently;
+            # the work is dominated by file I/O
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pending = deque()
+                for path_key, metadata in self.iter_calibre_metadata(author_filter):
+                    # Keep the book path as a plain string; Path objects are only built where needed
+                    book_path = os.path.join(self.calibre_path_str, path_key)
+                    
+                    if not self.book_dir_exists(path_key):
+                        logger.warning("Book path does not exist: %s", book_path)
+                        continue
+                    
+                    self.stats['total_books'] += 1
+                    pending.append(executor.submit(self.migrate_book, book_path, metadata))
+                    
+                    # Bound the number of queued books so memory use stays flat, waiting only
+                    # for the oldest one so the workers always have books to process
+                    if len(pending) > MAX_PENDING_BOOKS:
+                        pending.popleft().result()
+                
+                for future in pending:
+                    future.result()
+        except sqlite3.Error as e:
+            logger.error(f"Error loading Calibre metadata: {str(e)}")
+            logger.error("Failed to load Calibre metadata. Exiting.")
+            return
         
         self.print_summary()
     
@@ -328,6 +593,15 @@ Examples:
   # Migrate only specific author
   python migrate.py /path/to/calibre/library /path/to/komga/library --author "Isaac Asimov"
   
+  # Hardlink files instead of copying (source and destination on the same filesystem)
+  python migrate.py /path/to/calibre/library /path/to/komga/library --hardlink
+  
+  # Move files instead of copying (removes them from the Calibre library)
+  python migrate.py /path/to/calibre/library /path/to/komga/library --move
+  
+  # Limit the number of books migrated concurrently
+  python migrate.py /path/to/calibre/library /path/to/komga/library --jobs 4
+  
   # Enable debug logging
   python migrate.py /path/to/calibre/library /path/to/komga/library --verbose
         '''
@@ -338,6 +612,16 @@ Examples:
     parser.add_argument('--dry-run', action='store_true', help='Show what would be migrated without actually copying files')
     parser.add_argument('--author', help='Filter by author name (case insensitive partial match)')
     parser.add_argument('--verbose', action='store_true', help='Enable verbose logging')
+    parser.add_argument('--jobs', type=int, default=DEFAULT_JOBS,
+                        help=f'Number of books to migrate concurrently (default: {DEFAULT_JOBS})')
+    
+    transfer_group = parser.add_mutually_exclusive_group()
+    transfer_group.add_argument('--hardlink', dest='transfer_mode', action='store_const', const='hardlink',
+                                help='Hardlink files instead of copying (requires the same filesystem)')
+    transfer_group.add_argument('--symlink', dest='transfer_mode', action='store_const', const='symlink',
+                                help='Symlink files instead of copying')
+    transfer_group.add_argument('--move', dest='transfer_mode', action='store_const', const='move',
+                                help='Move files instead of copying (removes them from the Calibre library)')
     
     args = parser.parse_args()
     
@@ -347,7 +631,9 @@ Examples:
     migrator = CalibreKomgaMigrator(
         calibre_path=args.calibre_path,
         komga_path=args.komga_path,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        transfer_mode=args.transfer_mode,
+        jobs=args.jobs
     )
     
     migrator.migrate_library(author_filter=args.author)